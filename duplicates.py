@@ -3,25 +3,164 @@ import sys
 import hashlib
 import time
 import csv
-import multiprocessing
+import filecmp
+import functools
+import mmap
+import concurrent.futures
+import contextlib
+import queue
+import threading
 import logging
 import argparse
 
 import tqdm
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # --- Setup Logging ---
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 log = logging.getLogger(__name__)
 
-def hashfile(path, blocksize=65536, hash_algo='sha256'):
-    """Generates the hash of a file in chunks."""
+# hashlib already dispatches to OpenSSL's SHA-NI code path where the CPU has it,
+# so the extra backends are the non-cryptographic xxh3 (optional 'xxhash'
+# package) and BLAKE3 (optional 'blake3' package). Deduplication only needs a
+# fingerprint, so the fastest available one is the default; --verify can rule
+# out hash collisions with a byte-by-byte comparison.
+HASH_ALGOS = ['md5', 'sha256'] + (['blake3'] if blake3 else []) + (['xxh3'] if xxhash else [])
+DEFAULT_HASH_ALGO = 'xxh3' if xxhash else 'blake3' if blake3 else 'sha256'
+
+# Algorithms for which colliding files can be crafted. Unattended deletion
+# (--delete --yes) with one of these always verifies matches byte by byte.
+WEAK_HASH_ALGOS = {'md5', 'xxh3'}
+
+# Pass 2 only hashes this many bytes from each end of a file before deciding
+# whether the whole file is worth hashing.
+PARTIAL_HASH_BLOCK = 4096
+
+# Files larger than this are memory-mapped and hashed in a single update() call,
+# unless they were modified less than MMAP_MIN_AGE seconds ago.
+MMAP_THRESHOLD = 1 << 20
+MMAP_MIN_AGE = 60
+
+# Files up to this size are grouped by their raw content in Pass 2 instead of
+# being hashed, since reading them costs about as much as fingerprinting them.
+SMALL_FILE_SIZE = 4096
+
+# Pass 3 hashes files up to HASH_BATCH_MAX_FILE_SIZE bytes in batches of
+# HASH_BATCH_SIZE per pool task.
+HASH_BATCH_SIZE = 16
+HASH_BATCH_MAX_FILE_SIZE = 256 * 1024
+
+# Progress bars are updated once per this many files rather than per file.
+PROGRESS_BATCH = 1024
+
+# Number of threads removing files in --yes mode.
+DELETE_WORKERS = 16
+
+# Each hashing thread keeps one read in flight, so the worker count is the I/O
+# queue depth seen by the disk. SSDs and NVMe drives benefit from a deep queue.
+# The directory walk and --verify each use a pool of the same size.
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+if hasattr(hashlib, 'file_digest'):
+    file_digest = hashlib.file_digest
+else:
+    def file_digest(fileobj, digest, _bufsize=2**18):
+        """Fallback for hashlib.file_digest() on Python < 3.11."""
+        hasher = hashlib.new(digest) if isinstance(digest, str) else digest()
+        buf = bytearray(_bufsize)
+        view = memoryview(buf)
+        while True:
+            size = fileobj.readinto(buf)
+            if not size:
+                break
+            hasher.update(view[:size])
+        return hasher
+
+def _new_hasher(hash_algo):
+    """Returns an empty hash object for the given algorithm name."""
+    if hash_algo == 'blake3':
+        return blake3.blake3()
+    if hash_algo == 'xxh3':
+        return xxhash.xxh3_64()
+    return hashlib.new(hash_algo)
+
+def fadvise(fd, *advice):
+    """
+    Passes POSIX_FADV_* access hints (given by suffix, e.g. 'SEQUENTIAL') for a
+    whole file to the kernel. The hints are best-effort, so this does nothing
+    where posix_fadvise is unavailable or the filesystem rejects them.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for name in advice:
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, 'POSIX_FADV_' + name))
+        except OSError:
+            pass
+
+def hashfile(path, hash_algo=DEFAULT_HASH_ALGO, drop_cache=True):
+    """Generates the hash of a file, picking the read path by algorithm and size."""
     try:
-        hasher = hashlib.new(hash_algo)
         with open(path, "rb") as file:
-            buf = file.read(blocksize)
-            while len(buf) > 0:
-                hasher.update(buf)
-                buf = file.read(blocksize)
+            before = os.fstat(file.fileno())
+            size = before.st_size
+            # A memory map turns a truncation by another process into SIGBUS,
+            # which kills the whole scan, so files modified in the last
+            # MMAP_MIN_AGE seconds (possibly still being written) are read
+            # with plain read() calls instead.
+            can_map = time.time() - before.st_mtime > MMAP_MIN_AGE
+            # Widen readahead up front, but only prefetch small files outright so
+            # that several large files hashed at once do not flood the page cache.
+            # Unless the pages are about to be read again (--verify), drop them
+            # afterwards so scanning a large tree does not evict everything else.
+            fadvise(file.fileno(), 'SEQUENTIAL')
+            if size <= MMAP_THRESHOLD:
+                fadvise(file.fileno(), 'WILLNEED')
+            try:
+                if hash_algo == 'blake3' and can_map:
+                    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                    hasher.update_mmap(path)
+                elif size > MMAP_THRESHOLD and can_map:
+                    hasher = _new_hasher(hash_algo)
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        hasher.update(mm)
+                else:
+                    hasher = file_digest(file, functools.partial(_new_hasher, hash_algo))
+            finally:
+                if drop_cache:
+                    fadvise(file.fileno(), 'DONTNEED')
+            after = os.fstat(file.fileno())
+            if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+                log.warning(f"Skipping '{path}' because it changed while being hashed.")
+                return None
+            return hasher.hexdigest()
+    except (FileNotFoundError, PermissionError, OSError) as e:
+        log.warning(f"Skipping '{path}' due to an OS error: {e}")
+        return None
+    except Exception as e:
+        log.error(f"An unexpected error occurred while hashing '{path}': {e}")
+        return None
+
+def partial_hashfile(path, hash_algo=DEFAULT_HASH_ALGO, blocksize=PARTIAL_HASH_BLOCK):
+    """Hashes the first and last blocks of a file, or all of it if it is small."""
+    try:
+        hasher = _new_hasher(hash_algo)
+        with open(path, "rb") as file:
+            hasher.update(file.read(blocksize))
+            if os.fstat(file.fileno()).st_size > 2 * blocksize:
+                file.seek(-blocksize, os.SEEK_END)
+            hasher.update(file.read())
         return hasher.hexdigest()
     except (FileNotFoundError, PermissionError, OSError) as e:
         log.warning(f"Skipping '{path}' due to an OS error: {e}")
@@ -30,69 +169,307 @@ def hashfile(path, blocksize=65536, hash_algo='sha256'):
         log.error(f"An unexpected error occurred while hashing '{path}': {e}")
         return None
 
-def process_file_for_hashing(path, hash_algo):
-    """Worker function for multiprocessing pool."""
-    return path, hashfile(path, hash_algo=hash_algo)
+def read_small_file(path):
+    """Returns the whole content of a small file, to be compared directly."""
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except (FileNotFoundError, PermissionError, OSError) as e:
+        log.warning(f"Skipping '{path}' due to an OS error: {e}")
+        return None
+    except Exception as e:
+        log.error(f"An unexpected error occurred while reading '{path}': {e}")
+        return None
+
+def fingerprint_file(path, size, hash_algo):
+    """Worker function for Pass 2: raw content for small files, else a partial hash."""
+    if size <= SMALL_FILE_SIZE:
+        return read_small_file(path)
+    return partial_hashfile(path, hash_algo=hash_algo)
+
+def process_file_for_hashing(path, hash_algo, drop_cache=True):
+    """Worker function for the hashing thread pool."""
+    return path, hashfile(path, hash_algo=hash_algo, drop_cache=drop_cache)
+
+def process_batch_for_hashing(paths, hash_algo, drop_cache=True):
+    """Worker function that hashes a batch of files in one pool task."""
+    return [process_file_for_hashing(path, hash_algo, drop_cache) for path in paths]
 
-def find_duplicates(parent_folder, hash_algo='sha256'):
+@contextlib.contextmanager
+def thread_pool(max_workers):
     """
-    Finds duplicate files using a two-pass approach.
-    Returns a dictionary of duplicate groups, where keys are hashes.
+    A ThreadPoolExecutor that drops its queued tasks if the body raises, so
+    Ctrl+C stops a scan right away instead of waiting for every pending file.
     """
-    size_map = {}
-    found_duplicates = {}
-    
-    # Pass 1: Group files by size
-    file_list = []
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
     try:
-        for dirName, _, filenames in os.walk(parent_folder):
-            for filename in filenames:
-                file_path = os.path.join(dirName, filename)
-                if os.path.islink(file_path):
-                    continue
-                file_list.append(file_path)
-    except PermissionError as e:
-        log.critical(f"Permission denied for '{parent_folder}'. Please run with administrator privileges. Exiting.")
-        sys.exit(1)
+        yield executor
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
 
-    log.info("Pass 1: Grouping by file size...")
-    with tqdm.tqdm(total=len(file_list), unit='files') as pbar:
-        for path in file_list:
+def _scan_dir(folder):
+    """
+    Reads a single directory and returns (files, subdirs), where files is a
+    list of (path, size, inode) for its regular files. Symlinks are skipped.
+    The size comes from DirEntry.stat(), which costs one lstat per file (none
+    on Windows, where the directory read already returns it). inode is
+    (st_dev, st_ino) for files with more than one hardlink, and None otherwise.
+    """
+    files, subdirs = [], []
+    # This loop runs once per directory entry, so the bound methods are looked
+    # up once. With follow_symlinks=False, symlinks are neither dirs nor files
+    # and fall through without a separate is_symlink() call.
+    add_file, add_subdir = files.append, subdirs.append
+    with os.scandir(folder) as entries:
+        for entry in entries:
             try:
-                file_size = os.path.getsize(path)
-                size_map.setdefault(file_size, []).append(path)
-            except Exception as e:
-                log.warning(f"Skipping '{path}' due to an error: {e}")
-            pbar.update(1)
-
-    potential_duplicates = {size: paths for size, paths in size_map.items() if len(paths) > 1}
-    total_to_hash = sum(len(paths) for paths in potential_duplicates.values())
-    
-    if total_to_hash == 0:
-        return {}
+                if entry.is_dir(follow_symlinks=False):
+                    add_subdir(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    # st_nlink is 0 on Windows, where DirEntry.stat() leaves the
+                    # inode fields unset.
+                    add_file((entry.path, stat.st_size, (stat.st_dev, stat.st_ino) if stat.st_nlink > 1 else None))
+            except OSError as e:
+                log.warning(f"Skipping '{entry.path}' due to an error: {e}")
+    return files, subdirs
+
+def scan_files(parent_folder, workers=DEFAULT_WORKERS, pbar=None):
+    """
+    Walks a directory tree with a pool of threads, each reading one directory
+    at a time, and yields a list of (path, size, inode) per directory as soon
+    as it has been read, so the caller can work while the walk continues.
+    Raises OSError if the top-level folder itself cannot be read.
+    """
+    files, subdirs = _scan_dir(parent_folder)
+    if pbar is not None:
+        pbar.update(len(files))
+
+    dir_queue = queue.Queue()
+    found_queue = queue.Queue()
+    for subdir in subdirs:
+        dir_queue.put(subdir)
+
+    def worker():
+        # Files counted by this thread but not yet reported to the progress bar.
+        pending = 0
+        while True:
+            folder = dir_queue.get()
+            if folder is None:
+                break
+            try:
+                found, subdirs = _scan_dir(folder)
+            except OSError as e:
+                log.warning(f"Skipping '{folder}' due to an error: {e}")
+            else:
+                found_queue.put(found)
+                for subdir in subdirs:
+                    dir_queue.put(subdir)
+                pending += len(found)
+                if pbar is not None and pending >= PROGRESS_BATCH:
+                    pbar.update(pending)
+                    pending = 0
+            finally:
+                dir_queue.task_done()
+        if pbar is not None and pending:
+            pbar.update(pending)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+
+    def finish():
+        # join() returns once every queued directory, including the ones the
+        # workers discovered along the way, has been processed.
+        dir_queue.join()
+        for _ in threads:
+            dir_queue.put(None)
+        for thread in threads:
+            thread.join()
+        found_queue.put(None)
+
+    for thread in threads:
+        thread.start()
+    threading.Thread(target=finish, daemon=True).start()
+
+    yield files
+    while (found := found_queue.get()) is not None:
+        yield found
+
+def locality_key(path):
+    """Sort key that keeps files from the same directory next to each other."""
+    return os.path.dirname(path), path
+
+def find_duplicates(parent_folder, hash_algo=DEFAULT_HASH_ALGO, workers=DEFAULT_WORKERS, drop_cache=True):
+    """
+    Finds duplicate files using a three-pass approach: size, then a hash of
+    the first and last blocks, then a hash of the full content. Pass
+    drop_cache=False if the files will be read again right after, e.g. by
+    verify_duplicates(), so Pass 3 leaves them in the page cache.
+    Returns a dictionary of duplicate groups, where keys are hashes (or the
+    file content itself for files of at most SMALL_FILE_SIZE bytes, or the
+    (st_dev, st_ino) pair for groups made only of hardlinks to one file).
+    """
+    # size -> ([paths to compare], {inode: path}). Hardlinks share one inode
+    # and therefore one content, so only the first path seen for each inode
+    # is compared; the others are added back to its group at the end.
+    size_map = {}
+    links = {}
+    link_inodes = {}
+    found_duplicates = {}
+    fingerprints = []
+
+    # All passes share one thread pool. hashlib releases the GIL while hashing,
+    # so threads parallelize as well as processes without the fork, pickling
+    # and IPC overhead.
+    with thread_pool(workers) as executor:
+        def fingerprint(file_size, path):
+            future = executor.submit(fingerprint_file, path, file_size, hash_algo)
+            fingerprints.append((file_size, path, future))
+
+        # Pass 1: Walk the tree in parallel and group files by size. Pass 2 is
+        # fed from here: as soon as a size is seen a second time, the files of
+        # that size start being fingerprinted while the walk goes on.
+        log.info("Pass 1: Grouping by file size...")
+        try:
+            with tqdm.tqdm(unit='files', miniters=PROGRESS_BATCH, mininterval=0.2) as pbar:
+                for found in scan_files(parent_folder, workers=workers, pbar=pbar):
+                    for path, file_size, inode in found:
+                        paths, inode_paths = size_map.setdefault(file_size, ([], {}))
+                        if inode is not None:
+                            if inode in inode_paths:
+                                representative = inode_paths[inode]
+                                links.setdefault(representative, []).append(path)
+                                link_inodes[representative] = inode
+                                continue
+                            inode_paths[inode] = path
+                        paths.append(path)
+                        if len(paths) == 2:
+                            fingerprint(file_size, paths[0])
+                        if len(paths) >= 2:
+                            fingerprint(file_size, path)
+        except PermissionError as e:
+            log.critical(f"Permission denied for '{parent_folder}'. Please run with administrator privileges. Exiting.")
+            sys.exit(1)
+
+        # Pass 2: Cheap fingerprint of the first and last blocks of same-size files
+        if fingerprints:
+            log.info("Pass 2: Comparing the first and last blocks of same-size files...")
+
+            partial_hashes = {}
+            with tqdm.tqdm(total=len(fingerprints), unit='files', miniters=PROGRESS_BATCH, mininterval=0.2) as pbar:
+                for i, (file_size, path, future) in enumerate(fingerprints, 1):
+                    partial_hash = future.result()
+                    if partial_hash is not None:
+                        partial_hashes.setdefault((file_size, partial_hash), []).append(path)
+                    if i % PROGRESS_BATCH == 0:
+                        pbar.update(PROGRESS_BATCH)
+                pbar.update(len(fingerprints) % PROGRESS_BATCH)
+
+            found_duplicates.update(compare_full_hashes(executor, partial_hashes, hash_algo, drop_cache))
+
+    # A hardlinked file that matched nothing else is still a duplicate of its
+    # own links, whether or not other files shared its size.
+    grouped = {path for file_paths in found_duplicates.values() for path in file_paths}
+    for representative, inode in link_inodes.items():
+        if representative not in grouped:
+            found_duplicates[inode] = [representative]
+
+    for key, file_paths in found_duplicates.items():
+        found_duplicates[key] = [linked for path in file_paths for linked in [path] + links.get(path, [])]
+
+    return found_duplicates
+
+def compare_full_hashes(executor, partial_hashes, hash_algo=DEFAULT_HASH_ALGO, drop_cache=True):
+    """
+    Runs Pass 3 on the executor over the {(size, partial hash): [paths]} groups
+    from Pass 2 and returns the groups whose content matches, keyed as in
+    find_duplicates().
+    """
+    found_duplicates = {}
+
+    # Small files are hashed in batches so that each pool task does enough
+    # work to amortize the dispatch overhead. Large files get a task each.
+    # Both are ordered by directory so workers read neighbouring files.
+    small_files = []
+    large_files = []
+    for (size, partial_hash), file_paths in partial_hashes.items():
+        if len(file_paths) < 2:
+            continue
+        if size <= 2 * PARTIAL_HASH_BLOCK:
+            # The partial hash (or raw content) already covered the whole file.
+            found_duplicates[partial_hash] = sorted(file_paths, key=locality_key)
+        elif size <= HASH_BATCH_MAX_FILE_SIZE:
+            small_files.extend(file_paths)
+        else:
+            large_files.extend(file_paths)
+    small_files.sort(key=locality_key)
+    large_files.sort(key=locality_key)
+    batches = [small_files[i:i + HASH_BATCH_SIZE] for i in range(0, len(small_files), HASH_BATCH_SIZE)]
+    batches.extend([path] for path in large_files)
+
+    if not batches:
+        return found_duplicates
+
+    # Pass 3: Full hash of the files whose partial hashes collided
+    log.info("Pass 3: Hashing potential duplicates with a thread pool...")
+
+    # Results are folded into the hashes dict as each batch finishes, in
+    # completion order, so a slow large file does not hold up the rest.
+    hash_worker = functools.partial(process_batch_for_hashing, hash_algo=hash_algo, drop_cache=drop_cache)
+    futures = [executor.submit(hash_worker, batch) for batch in batches]
 
-    # Pass 2: Hash comparison for files with identical sizes using multiprocessing
-    log.info("Pass 2: Hashing potential duplicates with multiprocessing...")
-    
-    tasks = []
-    for paths in potential_duplicates.values():
-        for path in paths:
-            tasks.append((path, hash_algo))
-    
-    with multiprocessing.Pool(os.cpu_count()) as pool:
-        results = list(tqdm.tqdm(pool.starmap(process_file_for_hashing, tasks), total=len(tasks), unit='files'))
-    
     hashes = {}
-    for path, file_hash in results:
-        if file_hash:
-            hashes.setdefault(file_hash, []).append(path)
+    with tqdm.tqdm(total=sum(len(batch) for batch in batches), unit='files', mininterval=0.2) as pbar:
+        for future in concurrent.futures.as_completed(futures):
+            batch_results = future.result()
+            for path, file_hash in batch_results:
+                if file_hash:
+                    hashes.setdefault(file_hash, []).append(path)
+            pbar.update(len(batch_results))
     
     for file_hash, file_paths in hashes.items():
         if len(file_paths) > 1:
-            found_duplicates[file_hash] = file_paths
+            found_duplicates[file_hash] = sorted(file_paths, key=locality_key)
 
     return found_duplicates
 
+def split_by_content(file_paths):
+    """Splits a group of paths into lists of files with byte-identical content."""
+    groups = []
+    for path in file_paths:
+        for group in groups:
+            try:
+                if os.path.samefile(group[0], path) or filecmp.cmp(group[0], path, shallow=False):
+                    group.append(path)
+                    break
+            except OSError as e:
+                log.warning(f"Skipping '{path}' due to an OS error: {e}")
+                break
+        else:
+            groups.append([path])
+    return [group for group in groups if len(group) > 1]
+
+def verify_duplicates(duplicate_groups, workers=DEFAULT_WORKERS):
+    """
+    Compares the files of every hashed duplicate group byte by byte and drops
+    any that only matched through a hash collision. Groups keyed by raw
+    content are already exact and are kept as they are.
+    """
+    log.info("Verifying duplicate groups byte by byte...")
+    verified = {key: paths for key, paths in duplicate_groups.items() if isinstance(key, bytes)}
+    hashed = [(key, paths) for key, paths in duplicate_groups.items() if not isinstance(key, bytes)]
+
+    with thread_pool(workers) as executor:
+        results = executor.map(lambda item: split_by_content(item[1]), hashed)
+        for (key, _), groups in tqdm.tqdm(zip(hashed, results), total=len(hashed), unit='groups'):
+            if len(groups) == 1:
+                verified[key] = groups[0]
+            else:
+                for i, group in enumerate(groups):
+                    verified[(key, i)] = group
+    return verified
+
 def save_to_csv(duplicate_groups, output_path):
     """Saves duplicate file pairs to a CSV file."""
     if not duplicate_groups:
@@ -100,19 +477,38 @@ def save_to_csv(duplicate_groups, output_path):
         return
 
     try:
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['Original File', 'Duplicate File'])
             
-            for file_paths in duplicate_groups.values():
-                original = file_paths[0]
-                for duplicate in file_paths[1:]:
-                    writer.writerow([original, duplicate])
+            rows = ((file_paths[0], duplicate) for file_paths in duplicate_groups.values() for duplicate in file_paths[1:])
+            writer.writerows(rows)
         log.info(f"\n✅ Duplicate file report saved to '{output_path}'.")
     except IOError as e:
         log.error(f"Failed to write to CSV file '{output_path}': {e}")
 
-def delete_duplicates(duplicate_groups, dry_run):
+def remove_file(path):
+    """Deletes a file, returning the error instead of raising it."""
+    try:
+        os.remove(path)
+        return None
+    except Exception as e:
+        return e
+
+def delete_all_duplicates(duplicate_groups):
+    """
+    Deletes every duplicate without prompting. unlink releases the GIL, so the
+    removals run on a thread pool to keep many of them in flight at once.
+    """
+    duplicates_to_delete = [dup for file_paths in duplicate_groups.values() for dup in file_paths[1:]]
+    with thread_pool(DELETE_WORKERS) as executor:
+        for dup, error in zip(duplicates_to_delete, executor.map(remove_file, duplicates_to_delete)):
+            if error is None:
+                log.info(f"  -> Deleted: {dup}")
+            else:
+                log.error(f"  -> Error deleting {dup}: {error}")
+
+def delete_duplicates(duplicate_groups, dry_run, assume_yes=False):
     """Prompts for and handles deletion of duplicate files."""
     if not duplicate_groups:
         log.info("No duplicates to delete.")
@@ -121,6 +517,10 @@ def delete_duplicates(duplicate_groups, dry_run):
     log.info("\n--- Duplicate Deletion ---")
     log.info(f"Mode: {'Dry Run' if dry_run else 'Live'}")
 
+    if assume_yes and not dry_run:
+        delete_all_duplicates(duplicate_groups)
+        return
+
     for file_paths in duplicate_groups.values():
         original = file_paths[0]
         duplicates_to_delete = file_paths[1:]
@@ -167,11 +567,18 @@ def interactive_mode():
         dry_run_choice = input("Run in dry-run mode to see what would be deleted? (y/n): ").lower()
         dry_run = dry_run_choice == 'y'
 
-    hash_algo_choice = input("Choose a hashing algorithm (md5 or sha256): ").lower()
-    hash_algo = 'md5' if hash_algo_choice == 'md5' else 'sha256'
+    hash_algo_choice = input(f"Choose a hashing algorithm ({', '.join(HASH_ALGOS)}): ").lower()
+    hash_algo = hash_algo_choice if hash_algo_choice in HASH_ALGOS else DEFAULT_HASH_ALGO
     
     return directory_path, output_filename, delete, dry_run, hash_algo
 
+def positive_int(value):
+    """argparse type for options that need a count of at least one."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(
         description="Finds and manages duplicate files in a specified directory.",
@@ -180,22 +587,37 @@ def main():
     parser.add_argument("path", nargs='?', help="The full path of the directory to scan.", type=str, default=None)
     parser.add_argument("-o", "--output", help="The name of the CSV output file.", default="duplicate_files.csv", type=str)
     parser.add_argument("-d", "--delete", action="store_true", help="Prompts to delete duplicate files after scan.")
+    parser.add_argument("-y", "--yes", action="store_true", help="Deletes all duplicates without prompting (with --delete).")
     parser.add_argument("--dry-run", action="store_true", help="Shows what files would be deleted without removing them.")
-    parser.add_argument("--hash-algo", choices=['md5', 'sha256'], default='sha256', help="Hashing algorithm to use for file comparison.")
+    parser.add_argument("--hash-algo", choices=HASH_ALGOS, default=DEFAULT_HASH_ALGO, help="Hashing algorithm to use for file comparison.")
+    parser.add_argument("--verify", action="store_true", help="Compares matching files byte by byte to rule out hash collisions.")
+    parser.add_argument("-w", "--workers", type=positive_int, default=DEFAULT_WORKERS, help="Threads per stage: the directory walk and the hashing pool (the I/O queue depth) each use this many, as does --verify.")
     
     if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] in ['-h', '--help']):
         parser.print_help()
         directory_path, output_filename, delete, dry_run, hash_algo = interactive_mode()
+        workers = DEFAULT_WORKERS
+        assume_yes = False
+        verify = False
     else:
         args = parser.parse_args()
+        if args.yes and not args.delete:
+            parser.error("--yes only applies together with -d/--delete")
         directory_path = args.path
         output_filename = args.output
         delete = args.delete
         dry_run = args.dry_run
         hash_algo = args.hash_algo
+        workers = args.workers
+        assume_yes = args.yes
+        verify = args.verify
         
     if dry_run:
         log.info("Running in Dry Run mode. No files will be deleted.")
+
+    if delete and assume_yes and not dry_run and hash_algo in WEAK_HASH_ALGOS and not verify:
+        log.info(f"Deleting without prompts using '{hash_algo}', so matches will be verified byte by byte.")
+        verify = True
     
     if not os.path.isdir(directory_path):
         log.critical(f"Error: Directory '{directory_path}' not found or is not a valid directory.")
@@ -204,7 +626,9 @@ def main():
     start_time = time.time()
     log.info(f"Starting scan of '{directory_path}'...")
     
-    duplicate_groups = find_duplicates(directory_path, hash_algo=hash_algo)
+    duplicate_groups = find_duplicates(directory_path, hash_algo=hash_algo, workers=workers, drop_cache=not verify)
+    if verify:
+        duplicate_groups = verify_duplicates(duplicate_groups, workers=workers)
 
     if not duplicate_groups:
         log.info("\n🎉 No duplicate files found.")
@@ -218,7 +642,7 @@ def main():
     log.info(f"Scan completed in {elapsed_time:.2f} seconds.")
 
     if delete:
-        delete_duplicates(duplicate_groups, dry_run)
+        delete_duplicates(duplicate_groups, dry_run, assume_yes=assume_yes)
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+import duplicates
+
+
+@unittest.skipUnless(hasattr(os, 'link'), "hardlinks are not supported")
+class HardlinkTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        os.mkdir(os.path.join(self.root, 'd1'))
+        os.mkdir(os.path.join(self.root, 'd2'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, data):
+        path = os.path.join(self.root, name)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def groups(self):
+        result = duplicates.find_duplicates(self.root, hash_algo='sha256', workers=2)
+        return sorted(sorted(paths) for paths in result.values())
+
+    def test_hardlink_next_to_unrelated_file_of_same_size(self):
+        original = self.write(os.path.join('d1', 'a'), os.urandom(20000))
+        self.write(os.path.join('d1', 'b'), os.urandom(20000))
+        link = os.path.join(self.root, 'd2', 'a_link')
+        os.link(original, link)
+
+        self.assertEqual(self.groups(), [sorted([original, link])])
+
+    def test_hardlinks_only(self):
+        original = self.write(os.path.join('d1', 'a'), os.urandom(20000))
+        link = os.path.join(self.root, 'd2', 'a_link')
+        os.link(original, link)
+
+        self.assertEqual(self.groups(), [sorted([original, link])])
+
+
+if __name__ == '__main__':
+    unittest.main()